@@ -1,5 +1,8 @@
+import math
 import sys
 import re
+import string
+from dataclasses import dataclass
 from pathlib import Path
 
 # --- Configuration: reserved words & symbol patterns ---
@@ -7,239 +10,444 @@ RESERVED_WORDS = {"integer", "double", "output", "if"}
 SYMBOLS = {":", ";", ":=", "=", "+", "-", "(", ")", "<<", ">", "<", "==", "!=", '"'}
 
 # Regex patterns
-RE_DECL = re.compile(r'^\s*([A-Za-z]\w*)\s*:\s*(integer|double)\s*;\s*$', re.IGNORECASE)
-RE_ASSIGN = re.compile(r'^\s*([A-Za-z]\w*)\s*(?::=|=)\s*(.+?)\s*;\s*$', re.IGNORECASE)
-RE_OUTPUT = re.compile(r'^\s*output\s*<<\s*(.+?)\s*;\s*$', re.IGNORECASE)
-RE_IF = re.compile(r'^\s*if\s*\(\s*(.+?)\s*\)\s*(.+)$', re.IGNORECASE)
+# One pattern for every statement kind; the name of the alternative that
+# matched (m.lastgroup) is the statement kind.
+RE_LINE = re.compile(
+    r'(?i)^\s*(?:'
+    r'(?P<decl>(?P<decl_name>[A-Za-z]\w*)\s*:\s*(?P<decl_type>integer|double)\s*;)'
+    r'|(?P<output>output\s*<<\s*(?P<output_expr>.+?)\s*;)'
+    r'|(?P<if>if\s*\(\s*(?P<if_cond>.+?)\s*\)\s*(?P<if_body>.+))'
+    r'|(?P<assign>(?P<assign_name>[A-Za-z]\w*)\s*(?::=|=)\s*(?P<assign_expr>.+?)\s*;)'
+    r')\s*$')
 
 RE_COND = re.compile(r'^\s*(.+?)\s*(==|!=|>|<)\s*(.+?)\s*$')
 
+# Expression characters (used by _tokenize_expr)
+EXPR_LETTERS = string.ascii_letters
+EXPR_NAME_CHARS = string.ascii_letters + string.digits
+EXPR_NUMBER_CHARS = string.digits + "."
+EXPR_SPACES = string.whitespace
+
+# Statement kinds (RE_LINE group names)
+STMT_DECL = "decl"
+STMT_ASSIGN = "assign"
+STMT_OUTPUT = "output"
+STMT_IF = "if"
+
+# Translation tables deleting whitespace: every character str.isspace() accepts,
+# which is exactly what \s matches. The table covering all of Unicode takes a
+# scan of every code point to build, so it is only built for non-ASCII sources.
+def _whitespace_table(limit):
+    return str.maketrans('', '', ''.join(filter(str.isspace, map(chr, range(limit)))))
+
+_WS_DELETE_ASCII = _whitespace_table(128)
+_ws_delete_all = None  # built by _ws_delete_table on first non-ASCII source
+
+def _ws_delete_table(s):
+    global _ws_delete_all
+    if s.isascii():
+        return _WS_DELETE_ASCII
+    if _ws_delete_all is None:
+        _ws_delete_all = _whitespace_table(sys.maxunicode + 1)
+    return _ws_delete_all
+
 # Helper: remove whitespace (spaces, tabs, newlines)
 def remove_whitespace_all(s: str) -> str:
-    return re.sub(r'\s+', '', s)
+    return s.translate(_ws_delete_table(s))
+
+# Reserved words and symbols for tokenize_symbols_and_reserved: whole words,
+# then the symbols from SYMBOLS, longest first so ":=" is matched before ":"
+_RES_SYM = frozenset(RESERVED_WORDS | SYMBOLS)
+RE_RES_SYM = re.compile('|'.join(
+    [r'\w+']
+    + [re.escape(sym) for sym in sorted(SYMBOLS, key=lambda sym: (-len(sym), sym)) if len(sym) > 1]
+    + ['[' + re.escape(''.join(sorted(sym for sym in SYMBOLS if len(sym) == 1))) + ']']))
 
 def tokenize_symbols_and_reserved(s: str):
+    """
+    Scan the source once and list the reserved words and symbols it uses,
+    each reported once, in order of first appearance.
+    """
     found = []
-    # collect reserved words
-    for word in RESERVED_WORDS:
-        if re.search(r'\b' + re.escape(word) + r'\b', s, re.IGNORECASE):
-            found.append(word)
-    # collect symbols
-    for sym in sorted(SYMBOLS, key=len, reverse=True):
-        if sym in s:
-            found.append(sym)
+    # dedupe in C first (dict keeps first-appearance order), then check the
+    # few distinct tokens; lower() can merge "IF" and "if", hence the second check
+    for tok in dict.fromkeys(RE_RES_SYM.findall(s)):
+        tok = tok.lower()
+        if tok in _RES_SYM and tok not in found:
+            found.append(tok)
     return found
 
+def _tokenize_expr(expr):
+    """
+    Split an expression into (kind, value) tokens in a single scan.
+    kind is "num", "name", "op" ("+" / "-"), "(" or ")".
+    Raises ValueError with the message to report on bad input.
+    """
+    tokens = []
+    i, n = 0, len(expr)
+    while i < n:
+        c = expr[i]
+        if c in EXPR_SPACES:
+            i += 1
+        elif c in EXPR_LETTERS:
+            j = i + 1
+            while j < n and expr[j] in EXPR_NAME_CHARS:
+                j += 1
+            tokens.append(("name", expr[i:j]))
+            i = j
+        elif c in EXPR_NUMBER_CHARS:
+            j = i + 1
+            while j < n and expr[j] in EXPR_NUMBER_CHARS:
+                j += 1
+            text = expr[i:j]
+            try:
+                if "." in text:
+                    val = float(text)
+                elif text[0] == "0" and text.strip("0"):
+                    # like Python: "0" / "00" are fine, "007" is not a decimal integer
+                    raise ValueError(text)
+                else:
+                    val = int(text)
+            except ValueError:
+                raise ValueError(f"Error evaluating expression '{expr}': invalid number '{text}'")
+            tokens.append(("num", val))
+            i = j
+        elif c == "+" or c == "-":
+            tokens.append(("op", c))
+            i += 1
+        elif c == "(" or c == ")":
+            tokens.append((c, c))
+            i += 1
+        else:
+            raise ValueError(f"Illegal character in expression '{expr}'")
+    return tokens
+
+def _to_rpn(tokens, expr):
+    """
+    Shunting-yard: reorder infix tokens into reverse polish notation.
+    A leading / bracketed "+" or "-" becomes the unary op "pos" / "neg".
+    Raises ValueError on malformed expressions.
+    """
+    out = []
+    ops = []
+    expect_operand = True
+    for kind, val in tokens:
+        if expect_operand:
+            if kind == "num" or kind == "name":
+                out.append((kind, val))
+                expect_operand = False
+            elif kind == "(":
+                ops.append(val)
+            elif kind == "op":
+                # unary ops bind tightest, so nothing is popped for them
+                ops.append("neg" if val == "-" else "pos")
+            else:
+                raise ValueError(f"Error evaluating expression '{expr}': missing operand")
+        elif kind == "op":
+            # + and - are left-associative: pop everything back to a "("
+            while ops and ops[-1] != "(":
+                out.append(("op", ops.pop()))
+            ops.append(val)
+            expect_operand = True
+        elif kind == ")":
+            while ops and ops[-1] != "(":
+                out.append(("op", ops.pop()))
+            if not ops:
+                raise ValueError(f"Error evaluating expression '{expr}': unbalanced parentheses")
+            ops.pop()
+        else:
+            raise ValueError(f"Error evaluating expression '{expr}': missing operator")
+    if expect_operand:
+        raise ValueError(f"Error evaluating expression '{expr}': missing operand")
+    while ops:
+        op = ops.pop()
+        if op == "(":
+            raise ValueError(f"Error evaluating expression '{expr}': unbalanced parentheses")
+        out.append(("op", op))
+    return out
+
+def _eval_rpn(rpn, variables):
+    """
+    Evaluate an RPN token list with a value stack, reading variables
+    from a name -> value mapping (None = declared but unassigned).
+    Raises ValueError for undeclared or unassigned variables.
+    """
+    stack = []
+    for kind, val in rpn:
+        if kind == "num":
+            stack.append(val)
+        elif kind == "name":
+            value = variables.get(val)
+            if value is None:
+                if val in variables:
+                    raise ValueError(f"Variable '{val}' used before assignment.")
+                raise ValueError(f"Undeclared variable '{val}' in expression.")
+            stack.append(value)
+        elif val == "+":
+            b = stack.pop()
+            stack.append(stack.pop() + b)
+        elif val == "-":
+            b = stack.pop()
+            stack.append(stack.pop() - b)
+        elif val == "neg":
+            stack.append(-stack.pop())
+        # "pos" leaves the operand unchanged
+    return stack[0]
+
+def _format_value(v):
+    # For display: integers and integer-like doubles without decimals,
+    # other doubles with 2 decimals (as per spec)
+    if isinstance(v, int):
+        return str(v)
+    if v.is_integer():
+        return str(int(v))
+    return f"{v:.2f}"
+
+# --- Parsed program (built by Interpreter.parse, executed by Interpreter.run) ---
+# __slots__ is spelled out (not dataclass(slots=True)) to keep Python 3.7 support
+@dataclass
+class CompiledExpr:
+    __slots__ = ("text", "rpn")
+    text: str  # source text, for error messages
+    rpn: list  # RPN tokens for _eval_rpn
+
+@dataclass
+class DeclStmt:
+    __slots__ = ("lineno", "name", "typ")
+    lineno: int
+    name: str
+    typ: str  # "integer" / "double"
+
+@dataclass
+class AssignStmt:
+    __slots__ = ("lineno", "name", "expr")
+    lineno: int
+    name: str
+    expr: CompiledExpr
+
+@dataclass
+class OutputStmt:
+    __slots__ = ("lineno", "text", "expr")
+    lineno: int
+    text: str  # string literal to print, or None to print expr
+    expr: CompiledExpr
+
+@dataclass
+class IfStmt:
+    __slots__ = ("lineno", "left", "op", "right", "body")
+    lineno: int
+    left: CompiledExpr
+    op: str  # "==", "!=", ">" or "<"
+    right: CompiledExpr
+    body: object  # AssignStmt or OutputStmt
+
 # Very small evaluator for arithmetic using declared variables
 class Interpreter:
+    __slots__ = ("_text", "program", "var_type", "var_val", "errors", "outputs", "_rpn_cache")
+
     def __init__(self, source_text):
-        self.source_lines = source_text.splitlines()
-        self.vars = {}  # name -> (type, value)
-        self.errors = []
+        self._text = source_text
+        self.program = []  # statements produced by parse()
+        self.var_type = {}  # name -> "integer" / "double", set once at declaration
+        self.var_val = {}  # name -> value, None until first assigned
+        self.errors = []  # (lineno or None, message), formatted by main()
         self.outputs = []
+        self._rpn_cache = {}  # expression text -> CompiledExpr
 
     def error(self, msg, lineno=None):
-        if lineno is not None:
-            self.errors.append(f"Line {lineno}: {msg}")
-        else:
-            self.errors.append(msg)
+        self.errors.append((lineno, msg))
 
-    def parse_and_run(self):
-        # First pass: process lines (strip comments if any; comments not specified)
-        for i, raw_line in enumerate(self.source_lines, start=1):
+    def parse(self):
+        """
+        Syntax-check the source and build self.program.
+        Lines with syntax errors are reported and left out.
+        """
+        program_append = self.program.append
+        # the list of lines lives only for this loop, it is not kept on the instance
+        # strip comments if any; comments not specified
+        for i, raw_line in enumerate(self._text.splitlines(), start=1):
             line = raw_line.strip()
             if line == "":
                 continue
-            # Declaration
-            m = RE_DECL.match(line)
-            if m:
-                name, typ = m.group(1), m.group(2).lower()
-                if name in self.vars:
-                    self.error(f"Variable '{name}' redeclared.", i)
-                else:
-                    self.vars[name] = (typ, None)
-                continue
-            # Assignment
-            m = RE_ASSIGN.match(line)
-            if m:
-                name = m.group(1)
-                expr = m.group(2).strip()
-                if name not in self.vars:
-                    self.error(f"Assignment to undeclared variable '{name}'.", i)
-                    continue
-                typ, _ = self.vars[name]
-                # Evaluate expression (support + and - and numeric literals and variables)
-                val, ok = self.eval_expr(expr, i)
-                if not ok:
-                    continue
-                # Type conversion / check
-                if typ == "integer":
-                    try:
-                        val = int(round(float(val)))
-                    except Exception:
-                        self.error(f"Cannot convert value to integer for '{name}'.", i)
-                        continue
-                else:  # double
-                    val = float(val)
-                self.vars[name] = (typ, val)
+            m = RE_LINE.match(line)
+            if not m:
+                self.error("Unrecognized or invalid syntax.", i)
                 continue
-            # Output
-            m = RE_OUTPUT.match(line)
-            if m:
-                payload = m.group(1).strip()
-                # String literal?
-                if payload.startswith('"') and payload.endswith('"'):
-                    self.outputs.append(payload[1:-1])
-                else:
-                    # assume expression or variable
-                    val, ok = self.eval_expr(payload, i)
-                    if not ok:
-                        continue
-                    # For display, format floats with up to 2 decimals (as per spec)
-                    if isinstance(val, float) and not val.is_integer():
-                        val = f"{val:.2f}"
-                    else:
-                        # integer-like float -> show as integer
-                        try:
-                            if float(val).is_integer():
-                                val = str(int(float(val)))
-                        except:
-                            val = str(val)
-                    self.outputs.append(str(val))
-                continue
-            # If statement (one-line form allowed)
-            m = RE_IF.match(line)
-            if m:
-                cond = m.group(1).strip()
-                stmt = m.group(2).strip()
-                cond_ok, cond_res = self.eval_condition(cond, i)
-                if cond_ok is None:
-                    continue  # error already reported
-                if cond_res:
-                    # treat stmt as a line by itself (could be an output or assignment)
-                    # we will reuse the parsers by feeding it to a small temporary interpreter call
-                    # but to keep it simple, we mimic only output and assignment handling
-                    # ensure statement ends with semicolon per examples
-                    if not stmt.endswith(";"):
-                        self.error("Statement inside if must end with semicolon.", i)
-                    else:
-                        # Use the same matching as above by temporarily matching patterns
-                        # Assignment inside if
-                        m2 = RE_ASSIGN.match(stmt)
-                        if m2:
-                            name = m2.group(1)
-                            expr = m2.group(2).strip()
-                            if name not in self.vars:
-                                self.error(f"Assignment to undeclared variable '{name}' inside if.", i)
-                                continue
-                            typ, _ = self.vars[name]
-                            val, ok = self.eval_expr(expr, i)
-                            if not ok:
-                                continue
-                            if typ == "integer":
-                                try:
-                                    val = int(round(float(val)))
-                                except Exception:
-                                    self.error(f"Cannot convert value to integer for '{name}'.", i)
-                                    continue
-                            else:
-                                val = float(val)
-                            self.vars[name] = (typ, val)
-                            continue
-                        # Output inside if
-                        m2 = RE_OUTPUT.match(stmt)
-                        if m2:
-                            payload = m2.group(1).strip()
-                            if payload.startswith('"') and payload.endswith('"'):
-                                self.outputs.append(payload[1:-1])
-                            else:
-                                val, ok = self.eval_expr(payload, i)
-                                if not ok:
-                                    continue
-                                if isinstance(val, float) and not val.is_integer():
-                                    val = f"{val:.2f}"
-                                else:
-                                    try:
-                                        if float(val).is_integer():
-                                            val = str(int(float(val)))
-                                    except:
-                                        val = str(val)
-                                self.outputs.append(str(val))
-                            continue
-                        self.error("Unsupported statement inside If.", i)
-                continue
-            # If reached here, unrecognized syntax
-            self.error("Unrecognized or invalid syntax.", i)
+            kind = m.lastgroup
+            if kind == STMT_DECL:
+                stmt = DeclStmt(i, m.group("decl_name"), m.group("decl_type").lower())
+            elif kind == STMT_IF:
+                stmt = self._parse_if(m, i)
+            else:
+                stmt = self._parse_simple(m, i)
+            if stmt is not None:
+                program_append(stmt)
+
+    def _parse_simple(self, m, lineno):
+        # m is an RE_LINE "assign" or "output" match
+        if m.lastgroup == STMT_ASSIGN:
+            expr = self.compile_expr(m.group("assign_expr").strip(), lineno)
+            if expr is None:
+                return None
+            return AssignStmt(lineno, m.group("assign_name"), expr)
+        payload = m.group("output_expr").strip()
+        # String literal?
+        if payload.startswith('"') and payload.endswith('"'):
+            return OutputStmt(lineno, payload[1:-1], None)
+        # assume expression or variable
+        expr = self.compile_expr(payload, lineno)
+        if expr is None:
+            return None
+        return OutputStmt(lineno, None, expr)
+
+    def _parse_if(self, m, lineno):
+        # one-line form only: if (cond) stmt;
+        cond = m.group("if_cond").strip()
+        body = m.group("if_body").strip()
+        # cond like: x < 5  or  x == 3+2
+        mc = RE_COND.match(cond)
+        if not mc:
+            self.error(f"Invalid condition format: '{cond}'", lineno)
+            return None
+        left = self.compile_expr(mc.group(1).strip(), lineno)
+        if left is None:
+            return None
+        right = self.compile_expr(mc.group(3).strip(), lineno)
+        if right is None:
+            return None
+        # the body is a line by itself; only output and assignment are allowed
+        # ensure statement ends with semicolon per examples
+        if not body.endswith(";"):
+            self.error("Statement inside if must end with semicolon.", lineno)
+            return None
+        mb = RE_LINE.match(body)
+        if not mb or mb.lastgroup not in (STMT_ASSIGN, STMT_OUTPUT):
+            self.error("Unsupported statement inside If.", lineno)
+            return None
+        body_stmt = self._parse_simple(mb, lineno)
+        if body_stmt is None:
+            return None
+        return IfStmt(lineno, left, mc.group(2), right, body_stmt)
+
+    def compile_expr(self, text, lineno):
+        """
+        Tokenize an expression and convert it to RPN, once per distinct text.
+        Returns a CompiledExpr, or None after reporting an error.
+        """
+        expr = self._rpn_cache.get(text)
+        if expr is None:
+            try:
+                expr = CompiledExpr(text, _to_rpn(_tokenize_expr(text), text))
+            except ValueError as e:
+                self.error(str(e), lineno)
+                return None
+            self._rpn_cache[text] = expr
+        return expr
+
+    def run(self):
+        # execute the statements built by parse(), in order
+        handlers = {
+            DeclStmt: self._exec_decl,
+            AssignStmt: self._exec_assignment,
+            OutputStmt: self._exec_output,
+            IfStmt: self._exec_if,
+        }
+        for stmt in self.program:
+            handlers[type(stmt)](stmt)
+        # parse() reported the syntax errors before any runtime error; list them
+        # all in source order (stable, so one line's errors keep their order)
+        self.errors.sort(key=lambda e: e[0] or 0)
+
+    def _exec_decl(self, stmt):
+        if stmt.name in self.var_type:
+            self.error(f"Variable '{stmt.name}' redeclared.", stmt.lineno)
+        else:
+            self.var_type[stmt.name] = stmt.typ
+            self.var_val[stmt.name] = None
+
+    def _exec_assignment(self, stmt, inside_if=False):
+        # evaluate, convert to the declared type and store
+        name = stmt.name
+        typ = self.var_type.get(name)
+        if typ is None:
+            where = " inside if" if inside_if else ""
+            self.error(f"Assignment to undeclared variable '{name}'{where}.", stmt.lineno)
+            return
+        val, ok = self.eval_expr(stmt.expr, stmt.lineno)
+        if not ok:
+            return
+        # Type conversion / check
+        if typ == "integer":
+            # eval_expr already rejected inf / nan, so round() cannot fail
+            val = round(val)
+        else:  # double
+            try:
+                val = float(val)
+            except OverflowError:
+                # an int too large for a double, reported like eval_expr does
+                self.error(f"Error evaluating expression '{stmt.expr.text}': numeric overflow", stmt.lineno)
+                return
+        self.var_val[name] = val
+
+    def _exec_output(self, stmt):
+        if stmt.text is not None:
+            self.outputs.append(stmt.text)
+            return
+        val, ok = self.eval_expr(stmt.expr, stmt.lineno)
+        if not ok:
+            return
+        self.outputs.append(_format_value(val))
+
+    def _exec_if(self, stmt):
+        cond_ok, cond_res = self.eval_condition(stmt)
+        if cond_ok is None:
+            return  # error already reported
+        if cond_res:
+            if type(stmt.body) is AssignStmt:
+                self._exec_assignment(stmt.body, inside_if=True)
+            else:
+                self._exec_output(stmt.body)
 
     def eval_expr(self, expr, lineno):
         """
-        Evaluate a simple arithmetic expression consisting of numbers (integer/double),
-        variable names, plus and minus only. No operator precedence beyond left-to-right
-        (which is enough for + and -).
+        Evaluate a compiled arithmetic expression consisting of numbers (integer/double),
+        variable names, plus and minus only, using the current variable values.
         Returns (value, ok).
         """
-        # replace variable names with their values
-        # split on + and - but keep signs
         try:
-            # validate tokens: allowed chars are letters, digits, ., +, -, parentheses, spaces
-            if re.search(r'[^A-Za-z0-9\.\+\-\(\)\s]', expr):
-                self.error(f"Illegal character in expression '{expr}'", lineno)
-                return (None, False)
-            # substitute variables
-            def var_repl(m):
-                name = m.group(0)
-                if name in self.vars:
-                    typ, val = self.vars[name]
-                    if val is None:
-                        self.error(f"Variable '{name}' used before assignment.", lineno)
-                        raise ValueError("unassigned")
-                    return str(val)
-                else:
-                    self.error(f"Undeclared variable '{name}' in expression.", lineno)
-                    raise ValueError("undeclared")
-            expr_sub = re.sub(r'\b[A-Za-z]\w*\b', var_repl, expr)
-            # now evaluate expression safely: only digits, ., +, -, parentheses remain
-            # as a final safety check:
-            if re.search(r'[^0-9\.\+\-\(\)\s]', expr_sub):
-                self.error(f"Illegal characters after substitution in '{expr_sub}'", lineno)
-                return (None, False)
-            # Evaluate using Python eval but in safe environment
-            val = eval(expr_sub, {"_builtins_": None}, {})
-            # return floats/ints
-            return (val, True)
-        except ValueError:
+            val = _eval_rpn(expr.rpn, self.var_val)
+        except ValueError as e:
+            self.error(str(e), lineno)
             return (None, False)
-        except Exception as e:
-            self.error(f"Error evaluating expression '{expr}': {e}", lineno)
+        except OverflowError:
+            # an int too large to mix with a double
+            val = math.inf
+        # doubles that overflowed (inf, or nan from inf - inf) are errors, not values
+        if type(val) is float and not math.isfinite(val):
+            self.error(f"Error evaluating expression '{expr.text}': numeric overflow", lineno)
             return (None, False)
+        # return floats/ints
+        return (val, True)
 
-    def eval_condition(self, cond, lineno):
-        # cond like: x < 5  or  x == 3+2
-        m = RE_COND.match(cond)
-        if not m:
-            self.error(f"Invalid condition format: '{cond}'", lineno)
-            return (None, False)
-        left, op, right = m.group(1).strip(), m.group(2), m.group(3).strip()
-        lv, ok1 = self.eval_expr(left, lineno)
+    def eval_condition(self, stmt):
+        lv, ok1 = self.eval_expr(stmt.left, stmt.lineno)
         if not ok1:
             return (None, False)
-        rv, ok2 = self.eval_expr(right, lineno)
+        rv, ok2 = self.eval_expr(stmt.right, stmt.lineno)
         if not ok2:
             return (None, False)
-        try:
-            if op == "==":
-                return (True, lv == rv)
-            elif op == "!=":
-                return (True, lv != rv)
-            elif op == ">":
-                return (True, lv > rv)
-            elif op == "<":
-                return (True, lv < rv)
-            else:
-                self.error(f"Unsupported operator '{op}' in condition.", lineno)
-                return (None, False)
-        except Exception as e:
-            self.error(f"Error evaluating condition: {e}", lineno)
+        # both sides are numbers, so comparing them cannot raise
+        op = stmt.op
+        if op == "==":
+            return (True, lv == rv)
+        elif op == "!=":
+            return (True, lv != rv)
+        elif op == ">":
+            return (True, lv > rv)
+        elif op == "<":
+            return (True, lv < rv)
+        else:
+            self.error(f"Unsupported operator '{op}' in condition.", stmt.lineno)
             return (None, False)
 
 def main():
@@ -264,7 +472,8 @@ def main():
 
     # Interpret / syntax-check
     interp = Interpreter(text)
-    interp.parse_and_run()
+    interp.parse()
+    interp.run()
 
     # Print outputs
     for o in interp.outputs:
@@ -274,8 +483,8 @@ def main():
     if interp.errors:
         print("ERROR")
         # Optionally print diagnostics lines (you can remove the next lines before submission if only "ERROR" required)
-        for e in interp.errors:
-            print(e)
+        for ln, msg in interp.errors:
+            print(f"Line {ln}: {msg}" if ln else msg)
     else:
         print("NO ERROR(S) FOUND")
 